@@ -3,7 +3,6 @@ from io import StringIO
 from pathlib import Path
 
 import pandas as pd
-from pandas.api.types import is_numeric_dtype
 
 from .PDB_constants import *
 from .PDB_dihedral_angle import pdb_dihedral_angle
@@ -74,92 +73,59 @@ def load_atom_models(name, fp:Path) -> List[Tuple[int, AtomModel]]:
     return a_models
 
 
-def parse_atom_model(atom_model:AtomModel, distance, disable_print=False) -> DataFrame:
-    # Create a dictionary to convert to DataFrame
-    atom_info = {
-        'Chain':   [],      # str
-        'ResName': [],      # str
-        'Atom':    [],      # str
-        'x':       [],      # float
-        'y':       [],      # float
-        'z':       [],      # float
-        'R':       [],      # float
-        'Type':    [],      # str
-        'Surf':    [],      # float
-        'Volu':    [],      # float
-    }
+def _atom_radius(Res:str, Ana:str, Ele:str) -> List[Union[float, str]]:
+    # Radius, type, surface, volume
+    if Res in Radius: # Standard residue
+        if Res in AA and Ana in Radius[Res]: # Amino acid
+            return Radius[Res][Ana]
+        if Res in NT and Ana[0] in Radius[Res]: # Nucleotide
+            return Radius[Res][Ele]
+        raise KeyError(f'Unknown atom {Ana} in residue {Res}')
+    elif Res in Radius['UNDEF']: # Non-standard residue
+        return Radius['UNDEF'][Ele]
+    else:
+        return Radius['UNDEF']['X']
 
-    for atom in atom_model:
-        Res = atom[17:20].lstrip()  # Residue name
-        Num = str(int(atom[22:26])) # Residue number
-        Ana = atom[12:16].strip()   # Atom name
-        Ele = atom[76:78].lstrip()  # Element type
-        
-        # Residue, atom, coordinates, radius, type, surface, volume
-        atom_info['Chain']  .append(atom[21] + Num)
-        atom_info['ResName'].append(Res)
-        atom_info['Atom']   .append(Ana)
-        atom_info['x']      .append(float(atom[30:38]))
-        atom_info['y']      .append(float(atom[38:46]))
-        atom_info['z']      .append(float(atom[46:54]))
-        
-        if Res in Radius: # Standard residue
-            if Res in AA and Ana in Radius[Res]: # Amino acid
-                __ = Radius[Res][Ana]
-                atom_info['R']   .append(__[0])
-                atom_info['Type'].append(__[1])
-                if distance == None:
-                    atom_info['Surf'].append(__[2])
-                    atom_info['Volu'].append(__[3])
-                else:
-                    new_r = __[0] + distance
-                    new_s = 4 * pi * (new_r)**2
-                    new_v = 4 * (pi * (new_r)**3) / 3
-                    atom_info['Surf'].append(new_s)
-                    atom_info['Volu'].append(new_v)
-                    
-            if Res in NT and Ana[0] in Radius[Res]: # Nucleotide
-                __ = Radius[Res][Ele]
-                atom_info['R']   .append(__[0])
-                atom_info['Type'].append(__[1])
-                if distance == None:
-                    atom_info['Surf'].append(__[2])
-                    atom_info['Volu'].append(__[3])
-                else:
-                    new_r = __[0] + distance
-                    new_s = 4 * pi * (new_r)**2
-                    new_v = 4 * (pi * (new_r)**3) / 3
-                    atom_info['Surf'].append(new_s)
-                    atom_info['Volu'].append(new_v)
-        
-        elif Res in Radius['UNDEF']: # Non-standard residue
-            __ = Radius['UNDEF'][Ele]
-            atom_info['R']   .append(__[0])
-            atom_info['Type'].append(__[1])
-            if distance == None:
-                atom_info['Surf'].append(__[2])
-                atom_info['Volu'].append(__[3])
-            else:
-                new_r = __[0] + distance
-                new_s = 4 * pi * (new_r)**2
-                new_v = 4 * (pi * (new_r)**3) / 3
-                atom_info['Surf'].append(new_s)
-                atom_info['Volu'].append(new_v)
-        else:
-            __ = Radius['UNDEF']['X']
-            atom_info['R']   .append(__[0])
-            atom_info['Type'].append(__[1])
-            if distance == None:
-                atom_info['Surf'].append(__[2])
-                atom_info['Volu'].append(__[3])
-            else:
-                new_r = __[0] + distance
-                new_s = 4 * pi * (new_r)**2
-                new_v = 4 * (pi * (new_r)**3) / 3
-                atom_info['Surf'].append(new_s)
-                atom_info['Volu'].append(new_v) 
 
-    atom_df = pd.DataFrame.from_dict(atom_info)
+def parse_atom_model(atom_model:AtomModel, distance, disable_print=False) -> DataFrame:
+    # Pack all lines into one fixed-width (80 columns) byte buffer, each PDB field is then a column slice
+    buf = ''.join(line.rstrip('\r\n').ljust(80)[:80] for line in atom_model).encode('ascii', errors='replace')
+    chars = np.frombuffer(buf, dtype='S1').reshape(-1, 80)     # [N, 80], S1
+    col = lambda s, e: np.ascontiguousarray(chars[:, s:e]).view(f'S{e - s}').ravel()    # [N], S{e-s}
+    
+    # Residue, atom, coordinates
+    Num = np.char.strip(col(22, 26)).astype(int).astype(str)   # Residue number
+    Chain = np.char.add(col(21, 22).astype(str), Num)
+    x = np.char.strip(col(30, 38)).astype(DTYPE)
+    y = np.char.strip(col(38, 46)).astype(DTYPE)
+    z = np.char.strip(col(46, 54)).astype(DTYPE)
+    
+    # Radius, type, surface, volume only depend on (residue name, atom name, element type), look up each unique key once
+    keys, inv = np.unique(np.char.add(col(12, 20), col(76, 78)), return_inverse=True)
+    Res = np.char.lstrip(col(17, 20)).astype(str)               # Residue name
+    Ana = np.char.strip (col(12, 16)).astype(str)               # Atom name
+    lut = [_atom_radius(k[5:8].lstrip(), k[0:4].strip(), k[8:10].lstrip()) for k in keys.astype(str)]
+    if distance != None:
+        new_r = lambda __: __[0] + distance
+        lut = [[__[0], __[1], 4 * pi * (new_r(__))**2, 4 * (pi * (new_r(__))**3) / 3] for __ in lut]
+    inv = inv.ravel()
+    R    = np.asarray([__[0] for __ in lut], dtype=DTYPE)[inv]
+    Type = np.asarray([__[1] for __ in lut], dtype=object)[inv]
+    Surf = np.asarray([__[2] for __ in lut], dtype=DTYPE)[inv]
+    Volu = np.asarray([__[3] for __ in lut], dtype=DTYPE)[inv]
+    
+    atom_df = pd.DataFrame({
+        'Chain':   Chain,   # str
+        'ResName': Res,     # str
+        'Atom':    Ana,     # str
+        'x':       x,       # DTYPE
+        'y':       y,       # DTYPE
+        'z':       z,       # DTYPE
+        'R':       R,       # DTYPE
+        'Type':    Type,    # str
+        'Surf':    Surf,    # DTYPE
+        'Volu':    Volu,    # DTYPE
+    })
 
     # NOTE: Add the radius of the water molecule
     if distance == None:
@@ -167,10 +133,6 @@ def parse_atom_model(atom_model:AtomModel, distance, disable_print=False) -> Dat
     else:
         atom_df['R'] += distance
     
-    for col in atom_df.columns:
-        if is_numeric_dtype(atom_df[col]): # Convert all values to np.float64 type
-            atom_df[col] = atom_df[col].astype(DTYPE, copy=False)
-    
     # Extract rows in the ResName column in the AA or NA dictionary
     aa = atom_df[atom_df['ResName'].isin(AA)]
     nt = atom_df[atom_df['ResName'].isin(NT)]